@@ -4,4 +4,4 @@ Core package for device management and MQTT integration.
 from .device import Device, DeviceProperty
 from .devicemanager import DeviceManager
 from .loopstate import LoopState
-from .mqtt import misc_task, mqtt_supervisor
+from .mqtt import mqtt_supervisor
@@ -1,10 +1,28 @@
 """
 MQTT discovery for Home Assistant integration.
 """
-from typing import ClassVar, Dict, List, Tuple, Optional
-import os
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping, Tuple, Optional, TextIO
+import atexit
+import json
+import logging
+import secrets
+import sys
 from os import environ as env
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to JSON encoded as UTF-8."""
+        return json.dumps(obj).encode()
+
+log = logging.getLogger(__name__)
+
+# Unchanged values are republished at most this often (seconds), so that
+# subscribers that missed the earlier message still get the current state.
+REPUBLISH_INTERVAL = 300.0
+
 
 class DeviceId:
     """
@@ -13,6 +31,7 @@ class DeviceId:
     _index : int = 0
     _is_initialized : bool = False
     _ids : ClassVar[List[str]] = []
+    _file : ClassVar[Optional[TextIO]] = None
 
     """ Class initializer to load existing IDs from file. """
     @classmethod
@@ -20,11 +39,19 @@ class DeviceId:
         if not cls._is_initialized:
             try:
                 with open("deviceids.txt", "r", encoding="utf-8") as f:
-                    cls._ids = [line.strip() for line in f.readlines()]
+                    cls._ids = f.read().splitlines()
             except FileNotFoundError:
                 cls._ids = []
             cls._is_initialized = True
 
+    @classmethod
+    def _append(cls, device_id: str):
+        """ Persist a new ID, keeping the file open for subsequent IDs. """
+        if cls._file is None:
+            # Line buffered, so every ID reaches the file as it is written
+            cls._file = open("deviceids.txt", "a", encoding="utf-8", buffering=1)
+            atexit.register(cls._file.close)
+        cls._file.write(device_id + "\n")
 
     @classmethod
     def get_next(cls) -> str:
@@ -37,11 +64,10 @@ class DeviceId:
             return device_id
         else:
             # Generate new, random 16-digit hex ID
-            new_id = f"0x{ hex(int.from_bytes(os.urandom(8), 'big'))[2:].rjust(16, '0')}"
+            new_id = "0x" + secrets.token_hex(8)
             cls._ids.append(new_id)
             cls._index += 1
-            with open("deviceids.txt", "a", encoding="utf-8") as f:
-                f.write(new_id + "\n")
+            cls._append(new_id)
             return new_id
         
 
@@ -53,7 +79,8 @@ class DeviceProperty(property):
     def __init__(self, fget=None, fset=None, fdel=None, doc=None):
         super().__init__(fget, fset, fdel, doc)
         self._name: str = ""
-        self.parent = None
+        self._state_suffix: str = ""
+        self._set_suffix: str = ""
         self.display_name: Optional[str] = None
         self.type: Optional[type] = None
 
@@ -64,12 +91,23 @@ class DeviceProperty(property):
 
     def __set_name__(self, owner, name: str) -> None:
         # Called when the descriptor is assigned to a class attribute
-        instance = self
-        while True:
-            instance._name = name
-            instance = instance.parent
-            if instance is None: 
-                break
+        self._name = name
+        self._state_suffix = name.lower() + "/state"
+        self._set_suffix = name.lower() + "/set"
+
+    def __set__(self, instance, value) -> None:
+        fset = self.fset
+        if fset is None:
+            raise AttributeError(f"property '{self._name}' has no setter")
+        fset(instance, value)
+        instance.on_property_changed(self._name, value)
+
+    def __delete__(self, instance) -> None:
+        fdel = self.fdel
+        if fdel is None:
+            raise AttributeError(f"property '{self._name}' has no deleter")
+        fdel(instance)
+        instance.on_property_changed(self._name, None)
 
     def serialize(self, value) -> str:
         """Serialize the property value to a string."""
@@ -89,70 +127,113 @@ class DeviceProperty(property):
 
     def _replace(self, fget=None, fset=None, fdel=None, doc=None):
         new = type(self)(fget, fset, fdel, doc)
-        new.parent = self
         return self._copy_metadata_to(new)
 
     def getter(self, fget):
         return self._replace(fget=fget, fset=self.fset, fdel=self.fdel, doc=self.__doc__)
 
     def setter(self, fset):
-        def new_setter(instance, value):
-            fset(instance, value)
-            instance.on_property_changed(self._name, value)
-
-        return self._replace(fget=self.fget, fset=new_setter, fdel=self.fdel, doc=self.__doc__)
+        return self._replace(fget=self.fget, fset=fset, fdel=self.fdel, doc=self.__doc__)
 
     def deleter(self, fdel):
-        def new_deleter(instance):
-            fdel(instance)
-            instance.on_property_changed(self._name, None)
-        return self._replace(fget=self.fget, fset=self.fset, fdel=new_deleter, doc=self.__doc__)
+        return self._replace(fget=self.fget, fset=self.fset, fdel=fdel, doc=self.__doc__)
 
 
+class _PropSetter:
+    """Callable that applies an MQTT command payload to a device property."""
+    __slots__ = ("device", "prop")
+
+    def __init__(self, device: "Device", prop: DeviceProperty):
+        self.device = device
+        self.prop = prop
+
+    def __call__(self, payload: str) -> None:
+        log.debug("Setting property via MQTT: %s", payload)
+        prop = self.prop
+        prop.__set__(self.device, prop.parse(payload))
+
 class DeviceMetaclass(type):
     """
     Metaclass for Home Assistant MQTT discovery devices.
     """
 
     def __new__(mcs, name, bases, attrs):
-        components = {}
-        for b in bases:
-            components.update(getattr(b, "components", {}))
-
-        for key, value in attrs.items():
-            if isinstance(value, DeviceProperty):
-                components[key] = value
-
-        attrs["components"] = components
+        components = {key: value
+                      for b in bases
+                      for key, value in getattr(b, "components", {}).items()}
+        components.update((key, value) for key, value in attrs.items()
+                          if isinstance(value, DeviceProperty))
+
+        # Components are fixed once the class exists, so expose them read-only
+        attrs["components"] = MappingProxyType(components)
+        attrs["_components_items"] = tuple(components.items())
         return super().__new__(mcs, name, bases, attrs)
 
 class Device(metaclass=DeviceMetaclass):
     """
     Base class for Home Assistant MQTT discovery devices.
     """
-    components:  ClassVar[Dict[str, DeviceProperty]]
+    __slots__ = ("root_topic", "discovery_prefix", "device_id", "device_name",
+                 "manufacturer", "model", "software_version", "serial_number",
+                 "hardware_version", "origin", "support_url", "manager",
+                 "_topic_prefix", "_state_topics", "_set_topics", "_pub_topics", "_pub_props",
+                 "_encoded", "_last_published", "_discovery_topic",
+                 "_discovery_payload", "_discovery_json")
+    components:  ClassVar[Mapping[str, DeviceProperty]]
+    _components_items: ClassVar[Tuple[Tuple[str, DeviceProperty], ...]]
     def __init__(self, **kwargs):
-        args = {**kwargs, **env}
-        self.root_topic : str = args.get("root_topic", self.__class__.__name__.lower())
-        self.discovery_prefix : str = args.get("discovery_prefix", "homeassistant")
-        self.device_id : str = args.get("device_id", DeviceId.get_next())
-        self.device_name : str = args.get("device_name", self.__class__.__name__)
-        self.manufacturer : str = args.get("manufacturer", "Unknown")
-        self.model : str = args.get("model", "Unknown")
-        self.software_version : str = args.get("software_version", "1.0")
-        self.serial_number : Optional[str] = args.get("serial_number", "")
-        self.hardware_version : str = args.get("hardware_version", "1.0")
-        self.origin: str = args.get("origin", "Unknown")
-        self.support_url: str = args.get("support_url", "https://example.com/support")
+        def arg(key, default=None):
+            # Explicit keyword arguments win over the environment
+            value = kwargs.get(key)
+            return value if value is not None else env.get(key, default)
+
+        self.root_topic : str = sys.intern(arg("root_topic", self.__class__.__name__.lower()))
+        self.discovery_prefix : str = arg("discovery_prefix", "homeassistant")
+        self.device_id : str = sys.intern(arg("device_id") or DeviceId.get_next())
+        self.device_name : str = arg("device_name", self.__class__.__name__)
+        self.manufacturer : str = arg("manufacturer", "Unknown")
+        self.model : str = arg("model", "Unknown")
+        self.software_version : str = arg("software_version", "1.0")
+        self.serial_number : Optional[str] = arg("serial_number", "")
+        self.hardware_version : str = arg("hardware_version", "1.0")
+        self.origin: str = arg("origin", "Unknown")
+        self.support_url: str = arg("support_url", "https://example.com/support")
         self.manager = None
 
+        # Topics and discovery payload do not change after construction
+        self._topic_prefix: str = sys.intern(f"{self.root_topic}/{self.device_id}")
+        prefix = self._topic_prefix + "/"
+        self._state_topics: Dict[str, str] = {n: prefix + c._state_suffix
+                                              for n, c in self._components_items}
+        self._set_topics: Dict[str, str] = {n: prefix + c._set_suffix
+                                            for n, c in self._components_items
+                                            if not c.is_read_only}
+        self._pub_topics: Tuple[str, ...] = tuple(self._state_topics[n]
+                                                  for n, _ in self._components_items)
+        self._pub_props: Tuple[DeviceProperty, ...] = tuple(c for _, c in self._components_items)
+        self._encoded: Dict[str, Tuple[object, bytes]] = {}
+        self._last_published: Dict[str, Tuple[bytes, float]] = {}
+        self._discovery_topic: str = "/".join((self.discovery_prefix, "device",
+                                                self.device_id, "config"))
+        self._discovery_payload: dict = self._build_discovery_payload()
+        self._discovery_json: bytes = json_dumps(self._discovery_payload)
+
     @property
     def discovery_topic(self) -> str:
         """Generate MQTT topic for Home Assistant discovery."""
-        return f"{self.discovery_prefix}/device/{self.device_id}/config"
+        return self._discovery_topic
 
     @property
     def discovery_payload(self) -> dict:
+        """MQTT discovery configuration for Home Assistant."""
+        return self._discovery_payload
+
+    @property
+    def discovery_json(self) -> bytes:
+        """MQTT discovery configuration serialized as JSON."""
+        return self._discovery_json
+
+    def _build_discovery_payload(self) -> dict:
         """Generate MQTT discovery configuration for Home Assistant."""
         dev = {"ids": f"{self.device_id}",
                "name": f"{self.device_name}",
@@ -167,7 +248,7 @@ class Device(metaclass=DeviceMetaclass):
              "sw": f"{self.software_version}", 
              "url": f"{self.support_url}"}
 
-        cmps = {f"{self.device_id}_{n}": c.discovery_payload(self) for n, c in self.components.items()}
+        cmps = {f"{self.device_id}_{n}": c.discovery_payload(self) for n, c in self._components_items}
         return {"dev": dev, 
                 "o": o, 
                 "cmps": cmps, 
@@ -177,54 +258,56 @@ class Device(metaclass=DeviceMetaclass):
     @property
     def availability_topic(self) -> str:
         """Generate MQTT topic for device availability."""
-        return f"{self.root_topic}/{self.device_id}/availability"
+        return self._topic_prefix + "/availability"
 
     @property
     def value_topic(self) -> str:
         """Generate MQTT topic for device state."""
-        return f"{self.root_topic}/{self.device_id}/state"
+        return self._topic_prefix + "/state"
 
     @property
     def payloads(self):
         """Publish the values to mqtt server."""
-        components = self.__class__.__dict__.get("components", {})
-        payloads =  [(f"{self.root_topic}/{self.device_id}/{k.lower()}/state", v.serialize(v.fget(self)) if v.fget(self) else None)
-                     for k, v in components.items()]
-        payloads = [(t, p) for t, p in payloads if p is not None]
-        return payloads
+        encode = self._encode
+        for topic, prop in zip(self._pub_topics, self._pub_props):
+            value = prop.fget(self)
+            if value is not None:
+                yield topic, encode(topic, prop, value)
+
+    def _encode(self, topic: str, prop: DeviceProperty, value) -> bytes:
+        """Serialize a value for the topic, reusing the last encoding if unchanged."""
+        cached = self._encoded.get(topic)
+        if cached is not None and type(cached[0]) is type(value) and cached[0] == value:
+            return cached[1]
+        payload = prop.serialize(value).encode()
+        self._encoded[topic] = (value, payload)
+        return payload
+
+    def needs_publish(self, topic: str, payload: bytes, now: float) -> bool:
+        """Return False if the payload was already sent to the topic recently."""
+        last = self._last_published.get(topic)
+        return last is None or last[0] != payload or now - last[1] >= REPUBLISH_INTERVAL
+
+    def mark_published(self, topic: str, payload: bytes, now: float) -> None:
+        """Record that the payload was sent to the topic at the given time."""
+        self._last_published[topic] = (payload, now)
 
     @property
     def subscriptions(self) -> List[Tuple[str, int]]:
         """Generate MQTT subscriptions for command topics."""
-        subs = []
-
-        def create_setter(prop):
-            def s(payload):
-                print("Setting property via MQTT:", payload)
-                prop.fset(self, prop.parse(payload))
-            return s
-
-        for name, prop in self.components.items():
-            if prop.is_read_only:
-                continue
-
-            t = f"{self.root_topic}/{self.device_id}/{name.lower()}/set"
-            subs.append((t, create_setter(prop)))
-        return subs
+        components = self.components
+        return [(t, _PropSetter(self, components[name]))
+                for name, t in self._set_topics.items()]
 
     def on_property_changed(self, name, value):
         """Callback when a property value changes."""
         if value is None:
             return
-        print(f"Property changed: {name}, New Value: {value}")
-        if self.manager and self.manager.mqtt_client:
+        log.debug("Property changed: %s, New Value: %s", name, value)
+        manager = self.manager
+        if manager and manager.mqtt_client:
             prop = self.components.get(name)
             if prop is None:
                 return
-            topic = f"{self.root_topic}/{self.device_id}/{name.lower()}/state"
-            payload = prop.serialize(value)
-            try:
-                self.manager.mqtt_client.publish(topic, str(payload), qos=0, retain=False)
-                print(f"Published updated value to {topic}: {payload}")
-            except Exception as e:
-                print(f"Error publishing updated value: {e}")
+            topic = self._state_topics[name]
+            manager.queue_publish(self, topic, self._encode(topic, prop, value))
@@ -1,16 +1,27 @@
 """Device Manager for handling multiple devices."""
-import json
-from typing import Dict
+from typing import Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import time
 from .device import Device
 
+log = logging.getLogger(__name__)
+
+# Property changes are collected for at most this long (seconds), or until
+# this many distinct topics are pending, before they are published.
+PUBLISH_FLUSH_INTERVAL = 0.05
+PUBLISH_FLUSH_COUNT = 5
+
 class DeviceManager:
     """
     Manages multiple devices.
     """
     def __init__(self):
         self.devices: Dict[str, Device] = {}
-        self.subscriptions = {}
+        self.subscriptions: Dict[str, Callable[[str], None]] = {}
         self.mqtt_client = None
+        self._pending: Dict[str, Tuple[Device, bytes]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     def add_device(self, device: Device):
         """Add a device to the manager."""
@@ -33,11 +44,15 @@ class DeviceManager:
         """Subscribe to all device topics."""
         if self.mqtt_client is None:
             return
-        for device in self.devices.values():
-            # Subscribe to device topics
-            for topic, setter in device.subscriptions:
-                self.subscriptions[topic] = setter
-                self.mqtt_client.subscribe(topic)
+        # Build the lookup table in one pass and swap it in whole, so
+        # handle_message never sees a table that is being filled
+        table = {topic: setter
+                 for device in self.devices.values()
+                 for topic, setter in device.subscriptions}
+        self.subscriptions = table
+        # Subscribe to all topics with a single SUBSCRIBE packet
+        if table:
+            self.mqtt_client.subscribe([(topic, 0) for topic in table])
 
     def publish_discovery_topics(self):
         """Publish all discovery topics."""
@@ -46,20 +61,75 @@ class DeviceManager:
         for device in self.devices.values():
             # Publish discovery payloads
             topic = device.discovery_topic
-            payload = json.dumps(device.discovery_payload)
-            self.mqtt_client.publish(topic, payload, qos=0, retain=True)
+            self.mqtt_client.publish(topic, device.discovery_json, qos=0, retain=True)
 
     def handle_message(self, msg):
         """Handle incoming MQTT messages."""
-        setter = self.subscriptions.get(msg.topic, None)
-        if setter:
+        # paho decodes msg.topic to str, so it can be used as the key directly
+        setter = self.subscriptions.get(msg.topic)
+        if setter is not None:
             setter(msg.payload.decode())
 
     def publish_all(self):
         """Publish all device payloads."""
+        if self.mqtt_client is None:
+            return
+        publish = self.mqtt_client.publish
+        try:
+            # Collect every device's payloads first, then queue them in one pass.
+            # The client only queues packets here; the event loop writer drains
+            # the whole batch once the socket becomes writable.
+            messages = [(device, msg) for device in self.devices.values()
+                        for msg in device.payloads]
+            now = time.monotonic()
+            for device, (topic, payload) in messages:
+                publish(topic, payload, qos=0, retain=False)
+                device.mark_published(topic, payload, now)
+            # Everything pending was just published with its current value
+            self._pending.clear()
+        except Exception as e:
+            log.error("Error publishing payloads: %s", e)
+
+    def queue_publish(self, device: Device, topic: str, payload: bytes):
+        """
+        Queue a changed state value for publishing.
+
+        Repeated changes to the same topic before the next flush are
+        coalesced so that only the latest value is sent.
+        """
+        pending = self._pending
+        pending[topic] = (device, payload)
+        if len(pending) >= PUBLISH_FLUSH_COUNT:
+            self.flush_pending()
+        elif self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not running under an event loop, publish right away
+                self.flush_pending()
+                return
+            self._flush_handle = loop.call_later(PUBLISH_FLUSH_INTERVAL, self.flush_pending)
+
+    def flush_pending(self):
+        """Publish queued state values that differ from what was last sent."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = {}
+        if self.mqtt_client is None:
+            # Values are sent again by publish_all once reconnected
+            return
+        publish = self.mqtt_client.publish
+        now = time.monotonic()
         try:
-            for device in self.devices.values():
-                for topic, payload in device.payloads:
-                    self.mqtt_client.publish(topic, str(payload), qos=0, retain=False)
+            for topic, (device, payload) in pending.items():
+                if not device.needs_publish(topic, payload, now):
+                    continue
+                publish(topic, payload, qos=0, retain=False)
+                device.mark_published(topic, payload, now)
+                log.debug("Published updated value to %s: %s", topic, payload)
         except Exception as e:
-            print(f"Error publishing payloads: {e}")
\ No newline at end of file
+            log.error("Error publishing updated value: %s", e)
\ No newline at end of file
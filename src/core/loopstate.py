@@ -8,6 +8,7 @@ class LoopState:
         self.mqtt_connected = asyncio.Event()
         self.mqtt_client = None
         self.socket = None
+        self.writer_armed = False
         self.event_loop = None
         self.devices = None
         self.device_manager = None
@@ -1,21 +1,23 @@
 """MQTT client setup and connection handling."""
 import asyncio
+import logging
 import uuid
 from os import environ as env
 import paho.mqtt.client as mqtt
 from .loopstate import LoopState
 
-def create_mqtt_client(state: LoopState, on_connected, on_disconnected, on_message_received):
-    """Connect to the MQTT broker."""
-    def handle_read():
-        state.mqtt_client.loop_read()
+log = logging.getLogger(__name__)
 
-    def handle_write():
-        state.mqtt_client.loop_write()
+MISC_INTERVAL = 1.0
+RECONNECT_INTERVAL = 10.0
 
-    def on_socket_open(_client, _userdata, sock):
+def create_mqtt_client(state: LoopState, on_connected, on_disconnected, on_message_received):
+    """Connect to the MQTT broker."""
+    # The event loop drives paho's bound read/write methods directly,
+    # so no Python trampoline runs per socket event.
+    def on_socket_open(client, _userdata, sock):
         state.socket = sock
-        state.event_loop.add_reader(sock.fileno(), handle_read)
+        state.event_loop.add_reader(sock.fileno(), client.loop_read)
 
     def on_socket_close(_client, _userdata, _sock):
         if state.socket:
@@ -23,29 +25,45 @@ def create_mqtt_client(state: LoopState, on_connected, on_disconnected, on_messa
                 state.event_loop.remove_reader(state.socket.fileno())
             except Exception:
                 pass
+            if state.writer_armed:
+                try:
+                    state.event_loop.remove_writer(state.socket.fileno())
+                except Exception:
+                    pass
+        state.writer_armed = False
         state.socket = None
 
+    # The writer stays armed until paho's outgoing queue is drained, so a
+    # burst of publishes costs one add_writer/remove_writer pair in total.
     def on_socket_register_write(client, userdata, sock):
-        state.event_loop.add_writer(sock.fileno(), handle_write)
+        if state.writer_armed:
+            return
+        state.writer_armed = True
+        state.event_loop.add_writer(sock.fileno(), client.loop_write)
 
     def on_socket_unregister_write(client, userdata, sock):
+        if not state.writer_armed:
+            return
+        state.writer_armed = False
         try: 
             state.event_loop.remove_writer(sock.fileno())
         except Exception: 
             pass
 
     def on_connect(client, userdata, flags, rc):
-        print(f"Connected to MQTT Broker with result code {rc}")
+        log.info("Connected to MQTT Broker with result code %s", rc)
         state.mqtt_connected.set()
         on_connected(client)
 
     def on_disconnect(client, userdata, rc):
-        print(f"Disconnected from MQTT Broker with result code {rc}")
+        log.info("Disconnected from MQTT Broker with result code %s", rc)
         state.mqtt_connected.clear()
         on_disconnected(client)
 
     def on_message(client, userdata, msg):
-        print(f"Received message on {msg.topic}: {msg.payload}")
+        # msg.topic decodes on every access, so only touch it when logging
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Received message on %s: %s", msg.topic, msg.payload)
         on_message_received(msg)
 
 
@@ -61,46 +79,64 @@ def create_mqtt_client(state: LoopState, on_connected, on_disconnected, on_messa
     state.mqtt_client.username_pw_set(env.get("MQTT_USERNAME"), env.get("MQTT_PASSWORD"))
 
 
-async def misc_task(state: LoopState):
-    """Task to handle MQTT miscellaneous loop."""
-    print("Starting MQTT misc loop...")
-    try:
-        while state.stop.is_set() is False:
-            state.mqtt_client.loop_misc()
-            await asyncio.sleep(1.0)
-    except asyncio.CancelledError:
-        pass
-    print("MQTT misc loop stopped.")
-
 async def mqtt_supervisor(state: LoopState, on_connected, on_disconnected, on_message):
-    """Supervise MQTT connection."""
-    print("Starting MQTT supervisor...")
+    """
+    Supervise MQTT connection.
+
+    A single timer drives both paho's periodic housekeeping (loop_misc)
+    and the reconnect attempts. While connected it only wakes as often as
+    the keepalive requires; a disconnect or stop request wakes it at once.
+    """
+    log.info("Starting MQTT supervisor...")
+
+    wakeup = asyncio.Event()
+
+    def disconnected(client):
+        on_disconnected(client)
+        wakeup.set()
 
     create_mqtt_client(state, 
                  on_connected, 
-                 on_disconnected,
+                 disconnected,
                  on_message)
 
-    
+    host = env.get("MQTT_HOST")
+    port = int(env.get("MQTT_PORT", 1883))
+    keepalive = int(env.get("MQTT_KEEPALIVE", 60))
+    # paho sends PINGREQ once keepalive has elapsed at the next loop_misc,
+    # and the broker allows 1.5 x keepalive; a quarter keeps well inside it.
+    misc_interval = max(MISC_INTERVAL, keepalive / 4.0)
     initial_connect = True
+    next_connect = 0.0
+    stop_wait = asyncio.ensure_future(state.stop.wait())
     try:
         while state.stop.is_set() is False:
-            if state.mqtt_connected.is_set():
-                await asyncio.sleep(10.0)
-                continue
-            try:
-                if initial_connect:
-                    state.mqtt_client.connect(env.get("MQTT_HOST"),
-                                                int(env.get("MQTT_PORT", 1883)),
-                                                int(env.get("MQTT_KEEPALIVE", 60)))
-                    print("Initial MQTT connection successful.")
-                    initial_connect = False
-                else:
-                    state.mqtt_client.reconnect()
-                    print("Reconnecting MQTT server successful.")        
-            except Exception as e:
-                print(f"MQTT reconnect failed: {e}")
-            await asyncio.sleep(10.0)
+            state.mqtt_client.loop_misc()
+            now = state.event_loop.time()
+            connected = state.mqtt_connected.is_set()
+            if not connected and now >= next_connect:
+                next_connect = now + RECONNECT_INTERVAL
+                try:
+                    if initial_connect:
+                        state.mqtt_client.connect(host, port, keepalive)
+                        log.info("Initial MQTT connection successful.")
+                        initial_connect = False
+                    else:
+                        state.mqtt_client.reconnect()
+                        log.info("Reconnecting MQTT server successful.")
+                except Exception as e:
+                    log.warning("MQTT reconnect failed: %s", e)
+            if connected:
+                timeout = misc_interval
+            else:
+                timeout = min(misc_interval, max(MISC_INTERVAL, next_connect - now))
+            wake_wait = asyncio.ensure_future(wakeup.wait())
+            await asyncio.wait((stop_wait, wake_wait), timeout=timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+            wake_wait.cancel()
+            wakeup.clear()
     except asyncio.CancelledError:
         pass
-    print("MQTT supervisor stopped.")
+    finally:
+        stop_wait.cancel()
+    log.info("MQTT supervisor stopped.")
@@ -8,17 +8,31 @@ See: https://github.com/aalien/ouman/
 """
 
 import asyncio
+import logging
 import struct
 from os import environ as env
-from logging import debug
 import serial
 from core import Device
 from core.loopstate import LoopState
 from core.sensors import temperature, numeric, binary
 
+# Precompiled formats for the frame fields; commands and values are big endian
+_S8 = struct.Struct('b')
+_S16 = struct.Struct('!h')
+_S32 = struct.Struct('!i')
+_VAL_STRUCTS = {1: _S8, 2: _S16, 4: _S32}
+
+log = logging.getLogger(__name__)
+
+# Temperature readings moving less than this (°C) are not reported
+TEMPERATURE_EPSILON = 0.05
 
 class MeasurePoint:
     """Measure point as defined in the Ouman XML config file."""
+    __slots__ = ('idx', 'mask', 'name', 'datastart', 'dataend', 'unit',
+                 'divisor', '__ouman', '_raw_value', '_value', '_parse',
+                 'request_bytes')
+
     def __init__(self, index, mask, name, datastart, dataend, unit, divisor, parent):
         self.idx = index
         self.mask = mask
@@ -30,15 +44,27 @@ class MeasurePoint:
         self.__ouman = parent
         self._raw_value = None
         self._value = None
+        # Request frame for this point, filled in by the owning device
+        self.request_bytes = None
+        # Bound once, update() parses every point on every poll
+        self._parse = self.parse
 
     def read(self):
         """Read the value of this measure point from the Ouman device."""
-        self._raw_value = self.__ouman.read(self)
-        new_value = self.parse(self._raw_value)
-        if new_value != self._value:
+        self.update(self.__ouman.read(self))
+
+    def update(self, raw_value):
+        """Store a raw value read from the device and notify if it changed."""
+        self._raw_value = raw_value
+        new_value = self._parse(raw_value)
+        if new_value != self._value and self.is_significant(new_value):
             self._value = new_value
             self.__ouman.on_property_changed(self.name, self._value)
 
+    def is_significant(self, _new_value):
+        """Return True if a differing new value should be reported."""
+        return True
+
     @property
     def raw_value(self):
         """Return the raw value as read from the device."""
@@ -58,63 +84,36 @@ class Flags:
     Binary data measure point as defined in the Ouman XML config file.
     The intent of this class is to read flags only once per cycle.
     """
-    
+    __slots__ = ('raw_value', 'bit1', 'bit2', 'bit3', 'bit4',
+                 'bit5', 'bit6', 'bit7', 'bit8')
+
     def __init__(self, raw_value):
         self.raw_value = raw_value
-    
-    @property
-    def bit1(self):
-        """Return the state of bit 1."""
-        return bool(self.raw_value & 1)
-    
-    @property
-    def bit2(self):
-        """Return the state of bit 2."""
-        return bool(self.raw_value & 2)
-    
-    @property
-    def bit3(self):
-        """Return the state of bit 3."""
-        return bool(self.raw_value & 4)
-    
-    @property
-    def bit4(self):
-        """Return the state of bit 4."""
-        return bool(self.raw_value & 8)
-    
-    @property
-    def bit5(self):
-        """Return the state of bit 5."""
-        return bool(self.raw_value & 16)
-
-    @property
-    def bit6(self):
-        """Return the state of bit 6."""
-        return bool(self.raw_value & 32)
-    
-    @property
-    def bit7(self):
-        """Return the state of bit 7."""
-        return bool(self.raw_value & 64)
-    
-    @property
-    def bit8(self):
-        """Return the state of bit 8."""
-        return bool(self.raw_value & 128)
+        # Decode every bit once; reading a flag is then a plain attribute access
+        self.bit1 = bool(raw_value & 1)
+        self.bit2 = bool(raw_value & 2)
+        self.bit3 = bool(raw_value & 4)
+        self.bit4 = bool(raw_value & 8)
+        self.bit5 = bool(raw_value & 16)
+        self.bit6 = bool(raw_value & 32)
+        self.bit7 = bool(raw_value & 64)
+        self.bit8 = bool(raw_value & 128)
 
 
 class BinaryMeasurePoint(MeasurePoint):
     """Binary measure point as defined in the Ouman XML config file."""
-    
+    __slots__ = ()
+
     def parse(self, raw_value):
         """Parse the raw value to a boolean."""
         if raw_value is None:
             return None
-        return bool(raw_value & self.mask)
+        return (raw_value & self.mask) != 0
 
 class FlagsMeasurePoint(MeasurePoint):
     """Binary measure point as defined in the Ouman XML config file."""
-    
+    __slots__ = ()
+
     def parse(self, raw_value):
         """Parse the raw value to a boolean."""
         if raw_value is None:
@@ -123,9 +122,27 @@ class FlagsMeasurePoint(MeasurePoint):
 
 class NumericMeasurePoint(MeasurePoint):
     """Numeric measure point as defined in the Ouman XML config file."""
-    
+    __slots__ = ('epsilon',)
+
+    def __init__(self, *args, epsilon=0.0):
+        super().__init__(*args)
+        self.epsilon = epsilon
+
     def parse(self, raw_value):
-        return float(raw_value) / self.divisor if raw_value is not None else None
+        """Parse the raw value to a number scaled by the divisor."""
+        if raw_value is None:
+            return None
+        if self.divisor == 1:
+            # Counters and percentages need no scaling at all
+            return float(raw_value)
+        return raw_value / self.divisor
+
+    def is_significant(self, new_value):
+        """Ignore changes smaller than epsilon, compared to the last reported value."""
+        old_value = self._value
+        if new_value is None or old_value is None:
+            return True
+        return abs(new_value - old_value) >= self.epsilon
     
 class Ouman(Device):
     """Base class for Ouman devices."""
@@ -135,11 +152,22 @@ class Ouman(Device):
     def __init__(self, points,  *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__serio = None
+        self.__timeout = 1
+        # Receive buffer and pending response used by the event-driven reader
+        self.__rx = bytearray()
+        self.__pending = None
+        self.__points = tuple(points)
         self.__measurepoints = {mp.name: mp for mp in points}
+        # Direct references for the property getters, e.g. self._mp_relay1,
+        # and the fixed request frame each point is polled with
+        for mp in points:
+            setattr(self, f"_mp_{mp.name}", mp)
+            mp.request_bytes = self.__fmt_cmd(mp.idx)
 
     def connect(self, dev, baudrate=4800, timeout=1):
         """Connect to the Ouman device via serial port."""
         self.__serio = serial.Serial(dev, baudrate, timeout=timeout)
+        self.__timeout = timeout
         self.__serio.reset_input_buffer()
         self.__serio.reset_output_buffer()
 
@@ -149,70 +177,160 @@ class Ouman(Device):
     
     def read_all(self):
         """Read all measure points from the Ouman device."""
-        for mp in self.__measurepoints.values():
-            mp.read()
+        self.update_all(self.read_raw_all())
+
+    def read_raw_all(self):
+        """
+        Read the raw values of all measure points.
+        Only does serial I/O, so it can run in a worker thread.
+        """
+        read = self.__read
+        return [read(mp.idx, mp.datastart, mp.dataend, mp.request_bytes)
+                for mp in self.__points]
+
+    async def read_raw_all_async(self):
+        """
+        Read the raw values of all measure points without blocking.
+        Requires the serial port to be registered with start_reader.
+        """
+        read = self.__read_async
+        return [await read(mp.idx, mp.datastart, mp.dataend, mp.request_bytes)
+                for mp in self.__points]
+
+    def start_reader(self, loop) -> bool:
+        """
+        Have the event loop deliver serial data as it arrives.
+        Returns False where the loop cannot watch serial ports (Windows).
+        """
+        try:
+            loop.add_reader(self.__serio.fileno(), self.__on_readable)
+        except (NotImplementedError, AttributeError, ValueError):
+            return False
+        return True
+
+    def stop_reader(self, loop):
+        """Stop watching the serial port."""
+        try:
+            loop.remove_reader(self.__serio.fileno())
+        except (NotImplementedError, AttributeError, ValueError,
+                serial.SerialException, OSError):
+            pass
+
+    def update_all(self, raw_values):
+        """Apply raw values from read_raw_all to the measure points."""
+        for mp, raw_value in zip(self.__points, raw_values):
+            mp.update(raw_value)
 
     def read(self, measurepoint):
         """Read a measure point from the Ouman device."""
-        return self.__read(measurepoint.idx, measurepoint.datastart, measurepoint.dataend)
-
-    def __read(self, cmd, s, e):
-        debug('reading id %i', cmd)
-        buf = self.__fmt_cmd(cmd)
-        debug('sending %s', buf)
+        return self.__read(measurepoint.idx, measurepoint.datastart, measurepoint.dataend,
+                           measurepoint.request_bytes)
+
+    def __send(self, cmd, buf):
+        if buf is None:
+            buf = self.__fmt_cmd(cmd)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('reading id %i', cmd)
+            log.debug('sending %s', buf)
         self.__serio.write(buf)
-        self.__serio.flush()
 
-        # First two bytes should be STX+ACK
-        stx = self.__serio.read()
-        if stx != self.STX:
+    def __read(self, cmd, s, e, buf=None):
+        self.__send(cmd, buf)
+        # Blocking drain is fine here; this path runs off the event loop
+        self.__serio.flush()
+        # Header is STX, ACK and the data length
+        header = self.__serio.read(3)
+        if len(header) != 3 or header[0:1] != self.STX or header[1:2] != self.ACK:
+            return self.__parse(header, b'', cmd, s, e)
+        # Data is followed by the checksum byte
+        rest = self.__serio.read(header[2] + 1)
+        return self.__parse(header, rest, cmd, s, e)
+
+    async def __read_async(self, cmd, s, e, buf=None):
+        rx = self.__rx
+        rx.clear()
+        self.__pending = asyncio.get_running_loop().create_future()
+        self.__send(cmd, buf)
+        try:
+            await asyncio.wait_for(self.__pending, self.__timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.__pending = None
+        frame = bytes(rx)
+        return self.__parse(frame[:3], frame[3:], cmd, s, e)
+
+    def __on_readable(self):
+        # Called by the event loop when the serial port has data
+        serio = self.__serio
+        rx = self.__rx
+        pending = self.__pending
+        try:
+            rx += serio.read(serio.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            # The fd stays readable on a lost port; stop watching it rather
+            # than being called back in a tight loop, and fail the read now
+            log.error('Serial read failed: %s', e)
+            self.stop_reader(asyncio.get_running_loop())
+            if pending is not None and not pending.done():
+                pending.set_exception(e)
+            return
+        if pending is None or pending.done():
+            return
+        # Complete once the frame is known to be bad or all of it is here
+        if ((len(rx) >= 1 and rx[0] != self.STX[0]) or
+                (len(rx) >= 2 and rx[1] != self.ACK[0]) or
+                (len(rx) >= 3 and len(rx) >= rx[2] + 4)):
+            pending.set_result(None)
+
+    def __parse(self, header, rest, cmd, s, e):
+        """Validate a response frame and unpack the requested value from it."""
+        dbg = log.isEnabledFor(logging.DEBUG)
+        if len(header) != 3:
+            log.debug('Getting data length failed: header = %r', header)
             return None
-        ack = self.__serio.read()
-        if ack != self.ACK:
-            debug('serio failed: %s', ack)
+        if header[0:1] != self.STX:
             return None
-
-        datalen = self.__serio.read()
-        try:
-            n, = struct.unpack('B', datalen)
-            debug('datalen = %i', n)
-        except Exception as _:
-            debug(f'Getting data length failed: datalen = {datalen}')
+        if header[1:2] != self.ACK:
+            log.debug('serio failed: %s', header[1:2])
             return None
-
-        data = self.__serio.read(n)
-        checksum = self.__serio.read()
-        crc = self.__calc_crc(ack + datalen + data)
-        if not checksum or crc != checksum:
-            debug('checksum failed: %s != %s', crc, checksum)
+        n = header[2]
+        if dbg:
+            log.debug('datalen = %i', n)
+
+        data, checksum = rest[:n], rest[n:n + 1]
+        # Checksum is the 8-bit sum of ACK, length and data
+        crc = (header[1] + header[2] + sum(data)) & 0xff
+        if not checksum or crc != checksum[0]:
+            log.debug('checksum failed: %s != %r', crc, checksum)
             return None
 
-        debug('data = %s', repr(data))
-        cmd_str, data = data[0:2], data[2:]
-        cmd2, = struct.unpack('!h', cmd_str)
+        if dbg:
+            log.debug('data = %r', data)
+        cmd2, = _S16.unpack_from(data, 0)
         if cmd2 != cmd:
-            debug('command failed: %s != %s', cmd2, cmd)
+            log.debug('command failed: %s != %s', cmd2, cmd)
             return None
 
-        data = data[s:e + 1]
+        # Value offsets are relative to the data following the command
         value_len = e - s + 1
-        unpack_fmt = {1: 'b', 2: '!h', 4: '!i'}[value_len]
-        debug('unpacking %s with value_len = %i and unpack_fmt = %s', data, value_len, unpack_fmt)
-        val, = struct.unpack(unpack_fmt, data)
+        value_struct = _VAL_STRUCTS[value_len]
+        if dbg:
+            log.debug('unpacking %s with value_len = %i and unpack_fmt = %s',
+                      data[2 + s:3 + e], value_len, value_struct.format)
+        val, = value_struct.unpack_from(data, 2 + s)
 
         return val
 
-    def __calc_crc(self, data):
-        # crc is just an 8-bit sum
-        data = struct.unpack('B' * len(data), data)
-        crc = struct.pack('B', sum(data) & 0xff)
-        return crc
-
     def __fmt_cmd(self, cmd):
-        cmd = struct.pack('!h', cmd)  # commands are 16 bit
-        header = b'\x81' + bytearray((len(cmd),))
-        crc = self.__calc_crc(header + cmd)
-        return self.STX + header + cmd + crc
+        # STX, read request (0x81), command length, 16 bit command, checksum
+        buf = bytearray(6)
+        buf[0] = self.STX[0]
+        buf[1] = 0x81
+        buf[2] = 2
+        _S16.pack_into(buf, 3, cmd)
+        buf[5] = (buf[1] + buf[2] + buf[3] + buf[4]) & 0xff
+        return bytes(buf)
     
     async def poll_device(self, state: LoopState):
         """Poll data from the device."""
@@ -229,12 +347,28 @@ class Ouman(Device):
             print(f"Failed to connect to Ouman device: {e}")
             return
         
+        loop = asyncio.get_running_loop()
+        use_reader = self.start_reader(loop)
         while not state.stop.is_set():
             try:
-                self.read_all()
+                if use_reader:
+                    # Responses are collected as the port becomes readable
+                    raw_values = await self.read_raw_all_async()
+                else:
+                    # Blocking serial reads run in the default executor
+                    raw_values = await loop.run_in_executor(None, self.read_raw_all)
+                # Values are applied (and published) on the event loop thread
+                self.update_all(raw_values)
             except Exception as e:
                 print(f"Error while reading from Ouman device: {e}")
-            await asyncio.sleep(1)  
+            # Wait for the next cycle, but return at once on stop
+            try:
+                await asyncio.wait_for(state.stop.wait(), timeout=1)
+                break
+            except asyncio.TimeoutError:
+                pass
+        if use_reader:
+            self.stop_reader(loop)
         print("Polling Ouman stopped.")
 
     def get_measurepoint(self, name):
@@ -247,17 +381,28 @@ class OumanEH203(Ouman):
         points = []
         # Define measure points for Ouman EH-203 based on EH-203.xml
         # Analog measurements
-        points.append(NumericMeasurePoint(18, 0, "outdoor_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(20, 0, "h1_supply_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(21, 0, "h1_room_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(23, 0, "h1_return_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(26, 0, "h2_supply_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(27, 0, "measurement_6", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(24, 0, "hw_supply_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(25, 0, "hw_circulation_temperature", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(33, 0, "measurement_9", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(34, 0, "measurement_10", 0, 1, "C", 100, self))
-        points.append(NumericMeasurePoint(41, 0, "measurement_11", 0, 1, "C", 100, self))
+        points.append(NumericMeasurePoint(18, 0, "outdoor_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(20, 0, "h1_supply_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(21, 0, "h1_room_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(23, 0, "h1_return_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(26, 0, "h2_supply_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(27, 0, "measurement_6", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(24, 0, "hw_supply_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(25, 0, "hw_circulation_temperature", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(33, 0, "measurement_9", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(34, 0, "measurement_10", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
+        points.append(NumericMeasurePoint(41, 0, "measurement_11", 0, 1, "C", 100, self,
+                                          epsilon=TEMPERATURE_EPSILON))
 
         # Digital inputs
         points.append(BinaryMeasurePoint(45, 1, "digital_input1", 0, 1, "dig", 1, self))
@@ -290,134 +435,134 @@ class OumanEH203(Ouman):
     @temperature(unit="°C", display_name="Outdoor Temperature")
     def outdoor_temperature(self):
         """Return the outdoor temperature measure point value."""
-        return self.get_measurepoint('outdoor_temperature').value
+        return self._mp_outdoor_temperature.value
     
     @temperature(unit="°C", display_name="H1 Supply Temperature")
     def h1_supply_temperature(self):
         """Return the H1 supply temperature measure point value."""
-        return self.get_measurepoint('h1_supply_temperature').value
+        return self._mp_h1_supply_temperature.value
 
     @temperature(unit="°C", display_name="H1 Room Temperature")
     def h1_room_temperature(self):
         """Return the H1 room temperature measure point value."""
-        return self.get_measurepoint('h1_room_temperature').value
+        return self._mp_h1_room_temperature.value
     
     @temperature(unit="°C", display_name="H1 Return Temperature")
     def h1_return_temperature(self):
         """Return the H1 return temperature measure point value."""
-        return self.get_measurepoint('h1_return_temperature').value
+        return self._mp_h1_return_temperature.value
     
     @temperature(unit="°C", display_name="H2 Supply Temperature")
     def h2_supply_temperature(self):
         """Return the H2 supply temperature measure point value."""
-        return self.get_measurepoint('h2_supply_temperature').value
+        return self._mp_h2_supply_temperature.value
 
     @numeric(display_name="Measurement 6")
     def measurement_6(self):
         """Return the measurement 6 measure point value."""
-        return self.get_measurepoint('measurement_6').value
+        return self._mp_measurement_6.value
     
     @temperature(unit="°C", display_name="HW Supply Temperature")
     def hw_supply_temperature(self):
         """Return the HW supply temperature measure point value."""
-        return self.get_measurepoint('hw_supply_temperature').value
+        return self._mp_hw_supply_temperature.value
     
     @temperature(unit="°C", display_name="HW Circulation Temperature")
     def hw_circulation_temperature(self):
         """Return the HW circulation temperature measure point value."""
-        return self.get_measurepoint('hw_circulation_temperature').value
+        return self._mp_hw_circulation_temperature.value
     
     @numeric(display_name="Measurement 9")
     def measurement_9(self):
         """Return the measurement 9 measure point value."""
-        return self.get_measurepoint('measurement_9').value
+        return self._mp_measurement_9.value
     
     @numeric(display_name="Measurement 10")
     def measurement_10(self):
         """Return the measurement 10 measure point value."""
-        return self.get_measurepoint('measurement_10').value
+        return self._mp_measurement_10.value
     
     @numeric(display_name="Measurement 11")
     def measurement_11(self):
         """Return the measurement 11 measure point value."""
-        return self.get_measurepoint('measurement_11').value
+        return self._mp_measurement_11.value
 
     @binary(display_name="Digital Input 1")
     def digital_input1(self):
         """Return the state of digital input 1."""
-        return self.get_measurepoint('digital_input1').value
+        return self._mp_digital_input1.value
     
     @binary(display_name="Digital Input 2")
     def digital_input2(self):
         """Return the state of digital input 2."""
-        return self.get_measurepoint('digital_input2').value
+        return self._mp_digital_input2.value
     
     @binary(display_name="Digital Input 3")
     def digital_input3(self):
         """Return the state of digital input 3."""
-        return self.get_measurepoint('digital_input3').value
+        return self._mp_digital_input3.value
     
     @binary(display_name="Relay 1")
     def relay1(self):
         """Return the state of relay 1."""
-        return self.get_measurepoint('relay1').value
+        return self._mp_relay1.value
     
     @binary(display_name="Relay 2")
     def relay2(self):
         """Return the state of relay 2."""
-        return self.get_measurepoint('relay2').value
+        return self._mp_relay2.value
     
     @numeric(unit="%", display_name="H1 Valve Position")
     def h1_valve_position(self):
         """Return the H1 valve position measure point value."""
-        return self.get_measurepoint('h1_valve_position').value
+        return self._mp_h1_valve_position.value
     
     @numeric(unit="%", display_name="H2 Valve Position")
     def h2_valve_position(self):
         """Return the H2 valve position measure point value."""
-        return self.get_measurepoint('h2_valve_position').value
+        return self._mp_h2_valve_position.value
     
     @numeric(unit="%", display_name="HW Valve Position")
     def hw_valve_position(self):
         """Return the HW valve position measure point value."""
-        return self.get_measurepoint('hw_valve_position').value
+        return self._mp_hw_valve_position.value
 
 
     @temperature(unit="°C", display_name="H1 Room Setpoint")
     def h1_room_setpoint(self):
         """Return the H1 room setpoint measure point value."""
-        return self.get_measurepoint('h1_room_setpoint').value
+        return self._mp_h1_room_setpoint.value
     
 
     @temperature(unit="°C", display_name="H2 Room Setpoint")
     def h2_room_setpoint(self):
         """Return the H2 room setpoint measure point value."""
-        return self.get_measurepoint('h2_room_setpoint').value    
+        return self._mp_h2_room_setpoint.value    
 
     @temperature(unit="°C", display_name="HW Supply Setpoint")
     def hw_supply_setpoint(self):
         """Return the HW supply setpoint measure point value."""
-        return self.get_measurepoint('hw_supply_setpoint').value
+        return self._mp_hw_supply_setpoint.value
 
     @numeric(unit="kW", display_name="Peak Power")
     def peak_power(self):
         """Return the peak power measure point value."""
-        return self.get_measurepoint('peak_power').value 
+        return self._mp_peak_power.value 
     
     @numeric(unit="m3", display_name="Peak Flow")
     def peak_flow(self):
         """Return the peak flow measure point value."""
-        return self.get_measurepoint('peak_flow').value
+        return self._mp_peak_flow.value
 
     @numeric(unit="kWh", display_name="HW Energy")
     def hw_energy(self):
         """Return the HW energy measure point value."""
-        return self.get_measurepoint('hw_energy').value
+        return self._mp_hw_energy.value
     
     @numeric(unit="m3", display_name="HW Water")
     def hw_water(self):
         """Return the HW water measure point value."""
-        return self.get_measurepoint('hw_water').value
+        return self._mp_hw_water.value
 
 def create_devices():
     """Create and return a list of Ouman devices."""
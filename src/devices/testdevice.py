@@ -76,7 +76,12 @@ class TestDevice(Device):
                 self.temperature += 0.1  # Simulate temperature change
 
             print("Polling device...")
-            await asyncio.sleep(5)  # Simulate polling 
+            # Simulate polling, but return at once on stop
+            try:
+                await asyncio.wait_for(state.stop.wait(), timeout=5)
+                break
+            except asyncio.TimeoutError:
+                pass
         print("Polling task stopped.")
 
 def create_devices():
@@ -100,7 +105,7 @@ if __name__ == "__main__":
     print("Value Topic:")
     print(td.value_topic)
     print("Value Payload:")
-    print(json.dumps(td.payloads, indent=4))
+    print(json.dumps([(t, p.decode()) for t, p in td.payloads], indent=4))
     print("Subscriptions:")
     for topic, setter in td.subscriptions:
         print(f"Topic: {topic}, Setter: {setter}")
@@ -7,8 +7,11 @@ Based on the original Arduino implementation by Toni Korhonen (@kotope).
 See: https://github.com/kotope/valloxesp
 """
 import asyncio
+import struct
 import time
-from typing import Optional, Callable, Any
+from collections import deque
+from functools import partial
+from typing import Deque, Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 from os import environ as env
 import serial
@@ -19,8 +22,43 @@ from core.sensors import binary
 from core import LoopState
 from . import vallox_protocol as vp
 
-
-@dataclass
+# Bus addresses accepted as message sender / receiver
+VALID_SENDERS = frozenset((vp.VX_MSG_MAINBOARD_1, vp.VX_MSG_THIS_PANEL, vp.VX_MSG_PANEL_1))
+VALID_RECEIVERS = frozenset((vp.VX_MSG_PANELS, vp.VX_MSG_THIS_PANEL, vp.VX_MSG_PANEL_1,
+                             vp.VX_MSG_MAINBOARD_1, vp.VX_MSG_MAINBOARDS))
+
+# Wake-up interval of poll_device (seconds), when serial data is polled for
+# and when the event loop delivers it (retries and periodic queries only)
+POLL_INTERVAL = 0.1
+HOUSEKEEPING_INTERVAL = 1.0
+
+# One bit per variable that initialization waits for
+_STATUS_VARIABLES = (vp.VX_VARIABLE_STATUS, vp.VX_VARIABLE_IO_08, vp.VX_VARIABLE_FAN_SPEED,
+                     vp.VX_VARIABLE_DEFAULT_FAN_SPEED, vp.VX_VARIABLE_SERVICE_PERIOD,
+                     vp.VX_VARIABLE_SERVICE_COUNTER, vp.VX_VARIABLE_HEATING_TARGET)
+_TEMPERATURE_VARIABLES = (vp.VX_VARIABLE_T_OUTSIDE, vp.VX_VARIABLE_T_INSIDE,
+                          vp.VX_VARIABLE_T_EXHAUST, vp.VX_VARIABLE_T_INCOMING)
+RECEIVED_BITS = {v: 1 << i for i, v in enumerate(_STATUS_VARIABLES + _TEMPERATURE_VARIABLES)}
+STATUS_MASK = sum(RECEIVED_BITS[v] for v in _STATUS_VARIABLES)
+TEMPERATURE_MASK = sum(RECEIVED_BITS[v] for v in _TEMPERATURE_VARIABLES)
+RECEIVED_ALL = STATUS_MASK | TEMPERATURE_MASK
+
+# Frame layout: domain, sender, receiver, variable, value, checksum
+FRAME = struct.Struct(f"{vp.VX_MSG_LENGTH}B")
+
+# How long a CO2 half stays valid for combining with the other (seconds)
+CO2_LIFE_TIME = vp.CO2_LIFE_TIME_MS / 1000
+
+# Raw bytes and bookkeeping in Vallox.data that are not device state
+INTERNAL_DATA_KEYS = frozenset(('updated', 'co2_hi', 'co2_lo', 'status', 'variable08', 'flags06'))
+
+# Property names matching vp.VX_STATUS_FLAGS / vp.VX_08_FLAGS order
+STATUS_FLAG_NAMES = ('is_on', 'is_rh_mode', 'is_heating_mode', 'is_filter',
+                     'is_heating', 'is_fault', 'is_service_needed')
+VARIABLE08_FLAG_NAMES = ('is_summer_mode', 'is_error_relay', 'is_motor_in',
+                         'is_front_heating', 'is_motor_out', 'is_extra_func')
+
+@dataclass(slots=True)
 class ValueWithTimestamp:
     """Data structure to store value with timestamp"""
     value: Any = None
@@ -54,6 +92,12 @@ class Vallox(Device):
         self.baudrate = baudrate
         self._debug = debug
         self.serial: Optional[serial.Serial] = None
+        self._rx_buf = bytearray()
+        # Outgoing frames are built in place; serial writes copy the data
+        self._tx = bytearray(vp.VX_MSG_LENGTH)
+        self._tx[0] = vp.VX_MSG_DOMAIN
+        self._requests: Deque[int] = deque()
+        self._next_request = 0.0
 
         # Initialize data structures
         self.data = {
@@ -101,6 +145,27 @@ class Vallox(Device):
             'flags06': ValueWithTimestamp(),
         }
 
+        # Bits of RECEIVED_BITS for the variables received so far
+        self._received = 0
+
+        # Fields announced once initialization completes
+        self._public_keys = tuple(k for k in self.data if k not in INTERNAL_DATA_KEYS)
+
+        # Fields written on every matching frame, bound once
+        self._co2_hi = self.data['co2_hi']
+        self._co2_lo = self.data['co2_lo']
+        self._co2_field = self.data['co2']
+        self._co2_hilo = (-1, -1)  # Bytes behind the current CO2 value
+        self._status_field = self.data['status']
+        self._variable08_field = self.data['variable08']
+        self._flags06_field = self.data['flags06']
+        self._switch_active_field = self.data['is_switch_active']
+        self._heating_target_field = self.data['heating_target']
+
+        # Fields stamped together when their flag byte is received
+        self._status_fields = tuple(self.data[k] for k in STATUS_FLAG_NAMES)
+        self._variable08_fields = tuple(self.data[k] for k in VARIABLE08_FLAG_NAMES)
+
         # Settings
         self.settings = {
             'is_boost_setting': ValueWithTimestamp(),
@@ -111,8 +176,32 @@ class Vallox(Device):
         self.full_init_done = False
         self.last_requested = 0.0
         self.last_retry_loop = 0.0
+        # Time of the loop() pass being processed
+        self._now = 0.0
         self.status_mutex = False
 
+        # Decoders for received variables, called as handler(value, now)
+        data = self.data
+        self._handlers: Dict[int, Callable[[int, float], None]] = {
+            vp.VX_VARIABLE_T_OUTSIDE: partial(self._decode_temperature, 'outside_temp', data['outside_temp']),
+            vp.VX_VARIABLE_T_EXHAUST: partial(self._decode_temperature, 'exhaust_temp', data['exhaust_temp']),
+            vp.VX_VARIABLE_T_INSIDE: partial(self._decode_temperature, 'inside_temp', data['inside_temp']),
+            vp.VX_VARIABLE_T_INCOMING: partial(self._decode_temperature, 'incoming_temp', data['incoming_temp']),
+            vp.VX_VARIABLE_RH1: partial(self._decode_rh, 'rh1', data['rh1']),
+            vp.VX_VARIABLE_RH2: partial(self._decode_rh, 'rh2', data['rh2']),
+            vp.VX_VARIABLE_CO2_HI: partial(self._decode_co2, True),
+            vp.VX_VARIABLE_CO2_LO: partial(self._decode_co2, False),
+            vp.VX_VARIABLE_FAN_SPEED: partial(self._decode_fan_speed, 'fan_speed', data['fan_speed']),
+            vp.VX_VARIABLE_DEFAULT_FAN_SPEED: partial(self._decode_fan_speed, 'default_fan_speed', data['default_fan_speed']),
+            vp.VX_VARIABLE_STATUS: self._decode_status,
+            vp.VX_VARIABLE_IO_08: self._decode_variable08,
+            vp.VX_VARIABLE_FLAGS_06: self._decode_flags06,
+            vp.VX_VARIABLE_SERVICE_PERIOD: partial(self._decode_counter, 'service_period', data['service_period']),
+            vp.VX_VARIABLE_SERVICE_COUNTER: partial(self._decode_counter, 'service_counter', data['service_counter']),
+            vp.VX_VARIABLE_HEATING_TARGET: self._decode_heating_target,
+            vp.VX_VARIABLE_PROGRAM: self._decode_program,
+        }
+
         # Callbacks
         self.packet_callback: Optional[Callable] = None
         self.status_changed_callback: Optional[Callable] = None
@@ -136,6 +225,8 @@ class Vallox(Device):
                 timeout=0.1  # Non-blocking read with small timeout
             )
             self.full_init_done = False
+            self._rx_buf.clear()
+            self._requests.clear()
             self.request_config()
             return True
         except Exception as e:
@@ -148,6 +239,38 @@ class Vallox(Device):
         if self.serial and self.serial.is_open:
             self.serial.close()
 
+    def start_reader(self, loop) -> bool:
+        """
+        Have the event loop process serial data as it arrives.
+        Returns False where the loop cannot watch serial ports (Windows).
+        """
+        try:
+            loop.add_reader(self.serial.fileno(), self._on_readable)
+        except (NotImplementedError, AttributeError, ValueError):
+            return False
+        return True
+
+    def stop_reader(self, loop):
+        """Stop watching the serial port."""
+        try:
+            loop.remove_reader(self.serial.fileno())
+        except (NotImplementedError, AttributeError, ValueError,
+                serial.SerialException, OSError):
+            pass
+
+    def _on_readable(self):
+        # Called by the event loop when the serial port has data
+        serial_port = self.serial
+        try:
+            self._rx_buf += serial_port.read(serial_port.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            # The fd stays readable on a lost port; stop watching it rather
+            # than being called back in a tight loop
+            print(f"Vallox serial read failed: {e}")
+            self.stop_reader(asyncio.get_running_loop())
+            return
+        self.loop()
+
     def request_config(self):
         """Request all configuration from the Vallox unit"""
         self._send_status_req()
@@ -161,8 +284,9 @@ class Vallox(Device):
         self._send_flags06_req()
         self._send_program_req()
 
-        self.data['updated'] = time.monotonic()
-        self.last_requested = time.monotonic()
+        now = time.monotonic()
+        self.data['updated'] = now
+        self.last_requested = now
 
     def loop(self):
         """
@@ -170,15 +294,20 @@ class Vallox(Device):
 
         This should be called continuously to read and process messages from the bus.
         """
-        # Read and decode all available messages
-        while True:
-            message = self._read_message()
-            if message is None:
-                break
-            self._decode_message(message)
+        # Drain everything the port has buffered with a single read
+        if self.serial and self.serial.is_open:
+            waiting = self.serial.in_waiting
+            if waiting:
+                self._rx_buf += self.serial.read(waiting)
+
+        # One timestamp serves every message decoded in this pass
+        now = self._now = time.monotonic()
+
+        # Decode all complete messages
+        for message in self._read_messages():
+            self._decode_message(message, now)
 
         # Periodic queries
-        now = time.monotonic()
         if now - self.last_requested > vp.QUERY_INTERVAL:
             self.last_requested = now
             if self._is_status_init_done():
@@ -187,38 +316,52 @@ class Vallox(Device):
 
         # Retry loop
         if now - self.last_retry_loop > vp.RETRY_INTERVAL:
-            self._retry_loop()
+            self._retry_loop(now)
+
+        # Queued requests
+        self._send_next_request(now)
+
+    def next_wakeup(self) -> float:
+        """
+        Return how long (seconds) loop() may wait for bus data before it must
+        run again to send the next queued request or do housekeeping
+        """
+        if self._requests:
+            return vp.REQUEST_SPACING
+        return HOUSEKEEPING_INTERVAL
 
     # Properties (read-only)
+    # Published values are None until the unit has reported them, so fields
+    # the bus has not sent yet are left out of MQTT instead of faked as 0/OFF.
     @property
     def updated(self) -> float:
         """Get timestamp of last update"""
         return self.data['updated']
 
     @temperature(unit="°C", display_name="Inside Temperature")
-    def inside_temp(self) -> int:
+    def inside_temp(self) -> Optional[int]:
         """Get inside temperature in Celsius"""
-        return self.data['inside_temp'].value if self.data['inside_temp'].value is not None else 0
+        return self.data['inside_temp'].value
 
     @temperature(unit="°C", display_name="Outside Temperature")
-    def outside_temp(self) -> int:
+    def outside_temp(self) -> Optional[int]:
         """Get outside temperature in Celsius"""
-        return self.data['outside_temp'].value if self.data['outside_temp'].value is not None else 0
+        return self.data['outside_temp'].value
 
     @temperature(unit="°C", display_name="Incoming Temperature")
-    def incoming_temp(self) -> int:
+    def incoming_temp(self) -> Optional[int]:
         """Get incoming air temperature in Celsius"""
-        return self.data['incoming_temp'].value if self.data['incoming_temp'].value is not None else 0
+        return self.data['incoming_temp'].value
 
     @temperature(unit="°C",display_name="Exhaust Temperature")
-    def exhaust_temp(self) -> int:
+    def exhaust_temp(self) -> Optional[int]:
         """Get exhaust air temperature in Celsius"""
-        return self.data['exhaust_temp'].value if self.data['exhaust_temp'].value is not None else 0
+        return self.data['exhaust_temp'].value
 
     @switch(display_name="Unit Power State")
-    def is_on(self) -> bool:
+    def is_on(self) -> Optional[bool]:
         """Check if unit is powered on"""
-        return self.data['is_on'].value or False
+        return self.data['is_on'].value
     
     @is_on.setter
     def is_on(self, value: bool):
@@ -229,9 +372,9 @@ class Vallox(Device):
             self.set_off()
 
     @switch(display_name="RH Mode Active")
-    def is_rh_mode(self) -> bool:
+    def is_rh_mode(self) -> Optional[bool]:
         """Check if RH (humidity) mode is active"""
-        return self.data['is_rh_mode'].value or False
+        return self.data['is_rh_mode'].value
 
     @is_rh_mode.setter
     def is_rh_mode(self, value: bool):
@@ -242,9 +385,9 @@ class Vallox(Device):
             self.set_rh_mode_off()
 
     @switch(display_name="Heating Mode Active")
-    def is_heating_mode(self) -> bool:
+    def is_heating_mode(self) -> Optional[bool]:
         """Check if heating mode is active"""
-        return self.data['is_heating_mode'].value or False
+        return self.data['is_heating_mode'].value
     
     @is_heating_mode.setter
     def is_heating_mode(self, value: bool):
@@ -255,59 +398,59 @@ class Vallox(Device):
             self.set_heating_mode_off()
 
     @binary(display_name="Summer Mode Active", device_class="power")
-    def is_summer_mode(self) -> bool:
+    def is_summer_mode(self) -> Optional[bool]:
         """Check if summer mode is active"""
-        return self.data['is_summer_mode'].value or False
+        return self.data['is_summer_mode'].value
 
     @binary(display_name="Error Relay Active", device_class="problem")
-    def is_error_relay(self) -> bool:
+    def is_error_relay(self) -> Optional[bool]:
         """Check if error relay is active"""
-        return self.data['is_error_relay'].value or False
+        return self.data['is_error_relay'].value
 
     @binary(display_name="Intake Motor Running", device_class="power")
-    def is_motor_in(self) -> bool:
+    def is_motor_in(self) -> Optional[bool]:
         """Check if intake motor is running"""
-        return self.data['is_motor_in'].value or False
+        return self.data['is_motor_in'].value
 
     @binary(display_name="Front Heating Active", device_class="heat")
-    def is_front_heating(self) -> bool:
+    def is_front_heating(self) -> Optional[bool]:
         """Check if front heating is active"""
-        return self.data['is_front_heating'].value or False
+        return self.data['is_front_heating'].value
 
     @binary(display_name="Exhaust Motor Running", device_class="power")
-    def is_motor_out(self) -> bool:
+    def is_motor_out(self) -> Optional[bool]:
         """Check if exhaust motor is running"""
-        return self.data['is_motor_out'].value or False
+        return self.data['is_motor_out'].value
 
     @binary(display_name="Extra Function Active", device_class="power")
-    def is_extra_func(self) -> bool:
+    def is_extra_func(self) -> Optional[bool]:
         """Check if extra function is active"""
-        return self.data['is_extra_func'].value or False
+        return self.data['is_extra_func'].value
 
     @binary(display_name="Filter Warning", device_class="problem")
-    def is_filter(self) -> bool:
+    def is_filter(self) -> Optional[bool]:
         """Check if filter warning is active"""
-        return self.data['is_filter'].value or False
+        return self.data['is_filter'].value
 
     @binary(display_name="Heating Active", device_class="heat")
-    def is_heating(self) -> bool:
+    def is_heating(self) -> Optional[bool]:
         """Check if heating is active"""
-        return self.data['is_heating'].value or False
+        return self.data['is_heating'].value
 
     @binary(display_name="Fault Present", device_class="problem")
-    def is_fault(self) -> bool:
+    def is_fault(self) -> Optional[bool]:
         """Check if fault is present"""
-        return self.data['is_fault'].value or False
+        return self.data['is_fault'].value
 
     @binary(display_name="Service Needed", device_class="problem")
-    def is_service_needed(self) -> bool:
+    def is_service_needed(self) -> Optional[bool]:
         """Check if service is needed"""
-        return self.data['is_service_needed'].value or False
+        return self.data['is_service_needed'].value
 
     @switch(display_name="Boost/Fireplace Switch Active")
-    def is_switch_active(self) -> bool:
+    def is_switch_active(self) -> Optional[bool]:
         """Check if boost/fireplace switch is active"""
-        return self.data['is_switch_active'].value or False
+        return self.data['is_switch_active'].value
     
     @is_switch_active.setter
     def is_switch_active(self, value: bool):
@@ -318,23 +461,29 @@ class Vallox(Device):
     @property
     def rh1(self) -> int:
         """Get RH sensor 1 value (%)"""
-        if not self.data['rh1'].last_received:
+        field = self.data['rh1']
+        if not field.last_received:
             return vp.NOT_SET
-        return self.data['rh1'].value if self.data['rh1'].value is not None else vp.NOT_SET
+        value = field.value
+        return value if value is not None else vp.NOT_SET
 
     @property
     def rh2(self) -> int:
         """Get RH sensor 2 value (%)"""
-        if not self.data['rh2'].last_received:
+        field = self.data['rh2']
+        if not field.last_received:
             return vp.NOT_SET
-        return self.data['rh2'].value if self.data['rh2'].value is not None else vp.NOT_SET
+        value = field.value
+        return value if value is not None else vp.NOT_SET
 
     @property
     def co2(self) -> int:
         """Get CO2 sensor value (ppm)"""
-        if not self.data['co2'].last_received:
+        field = self.data['co2']
+        if not field.last_received:
             return vp.NOT_SET
-        return self.data['co2'].value if self.data['co2'].value is not None else vp.NOT_SET
+        value = field.value
+        return value if value is not None else vp.NOT_SET
 
     @property
     def switch_type(self) -> int:
@@ -350,9 +499,9 @@ class Vallox(Device):
 
     # Properties (read-write)
     @number(min_value=1, max_value=5, step=1, display_name="Fan Speed")
-    def fan_speed(self) -> int:
+    def fan_speed(self) -> Optional[int]:
         """Get current fan speed (1-8)"""
-        return self.data['fan_speed'].value if self.data['fan_speed'].value is not None else vp.NOT_SET
+        return self.data['fan_speed'].value
 
     @fan_speed.setter
     def fan_speed(self, speed: int):
@@ -365,7 +514,8 @@ class Vallox(Device):
     @property
     def default_fan_speed(self) -> int:
         """Get default fan speed (1-8)"""
-        return self.data['default_fan_speed'].value if self.data['default_fan_speed'].value is not None else vp.NOT_SET
+        value = self.data['default_fan_speed'].value
+        return value if value is not None else vp.NOT_SET
 
     @default_fan_speed.setter
     def default_fan_speed(self, speed: int):
@@ -376,9 +526,9 @@ class Vallox(Device):
             self._call_status_changed('default_fan_speed')
 
     @number(min_value=1, max_value=12, step=1, display_name="Service Period (Months)")
-    def service_period(self) -> int:
+    def service_period(self) -> Optional[int]:
         """Get service period in months"""
-        return self.data['service_period'].value if self.data['service_period'].value is not None else vp.NOT_SET
+        return self.data['service_period'].value
 
     @service_period.setter
     def service_period(self, months: int):
@@ -391,7 +541,8 @@ class Vallox(Device):
     @property
     def service_counter(self) -> int:
         """Get service counter in months"""
-        return self.data['service_counter'].value if self.data['service_counter'].value is not None else vp.NOT_SET
+        value = self.data['service_counter'].value
+        return value if value is not None else vp.NOT_SET
 
     @service_counter.setter
     def service_counter(self, months: int):
@@ -402,9 +553,9 @@ class Vallox(Device):
             self._call_status_changed('service_counter')
 
     @number(min_value=10, max_value=27, step=1, display_name="Heating Target Temperature (°C)")
-    def heating_target(self) -> int:
+    def heating_target(self) -> Optional[int]:
         """Get heating target temperature in Celsius"""
-        return self.data['heating_target'].value if self.data['heating_target'].value is not None else vp.NOT_SET
+        return self.data['heating_target'].value
 
     @heating_target.setter
     def heating_target(self, celsius: int):
@@ -497,203 +648,163 @@ class Vallox(Device):
         self.temperature_changed_callback = callback
 
     # Private methods - Serial communication
-    def _read_message(self) -> Optional[bytes]:
+    def _read_messages(self) -> List[bytes]:
         """
-        Read one complete message from serial port
+        Take all complete messages from the receive buffer
+
+        The buffer is walked by position and compacted once at the end, so
+        bytes preceding a frame are not shifted out one at a time.
 
         Returns:
-            Message bytes if a valid message was read, None otherwise
+            List of valid message bytes, oldest first
         """
-        if not self.serial or not self.serial.is_open:
-            return None
-
-        if self.serial.in_waiting < vp.VX_MSG_LENGTH:
-            return None
-
-        # Read first byte
-        first_byte = self.serial.read(1)
-        if len(first_byte) == 0 or first_byte[0] != vp.VX_MSG_DOMAIN:
-            return None
-
-        # Read next two bytes
-        sender = self.serial.read(1)
-        receiver = self.serial.read(1)
-
-        if len(sender) == 0 or len(receiver) == 0:
-            return None
-
-        sender_byte = sender[0]
-        receiver_byte = receiver[0]
-
-        # Filter messages
-        valid_sender = sender_byte in [vp.VX_MSG_MAINBOARD_1, vp.VX_MSG_THIS_PANEL, vp.VX_MSG_PANEL_1]
-        valid_receiver = receiver_byte in [vp.VX_MSG_PANELS, vp.VX_MSG_THIS_PANEL, vp.VX_MSG_PANEL_1, 
-                                          vp.VX_MSG_MAINBOARD_1, vp.VX_MSG_MAINBOARDS]
-
-        if not (valid_sender and valid_receiver):
-            return None
-
-        # Read rest of message
-        rest = self.serial.read(vp.VX_MSG_LENGTH - 3)
-        if len(rest) != vp.VX_MSG_LENGTH - 3:
-            return None
-
-        message = first_byte + sender + receiver + rest
-
-        if self._debug and self.packet_callback:
-            self.packet_callback(message, "packetRecv")
-
-        return message
-
-    def _decode_message(self, message: bytes):
+        buf = self._rx_buf
+        # Locals for the per-byte scan below
+        length = vp.VX_MSG_LENGTH
+        domain = vp.VX_MSG_DOMAIN
+        senders = VALID_SENDERS
+        receivers = VALID_RECEIVERS
+        packet_callback = self.packet_callback if self._debug else None
+        last = len(buf) - length
+        pos = 0
+        messages = []
+        while pos <= last:
+            # Skip to the start of a message that fits in the buffer
+            if buf[pos] != domain:
+                pos = buf.find(domain, pos, last + 1)
+                if pos < 0:
+                    pos = last + 1
+                    break
+                continue
+
+            # Filter messages
+            if buf[pos + 1] not in senders or buf[pos + 2] not in receivers:
+                pos += 1
+                continue
+
+            message = bytes(buf[pos:pos + length])
+            pos += length
+            if packet_callback:
+                packet_callback(message, "packetRecv")
+            messages.append(message)
+
+        if pos:
+            del buf[:pos]
+        return messages
+
+    def _decode_message(self, message: bytes, now: float):
         """Decode received message and update internal state"""
-        if not self._validate_checksum(message):
+        domain, sender, receiver, variable, value, checksum = FRAME.unpack(message)
+        if (domain + sender + receiver + variable + value) & 0xFF != checksum:
+            self._debug_print("Checksum comparison failed!")
             return
 
-        variable = message[3]
-        value = message[4]
-        now = time.monotonic()
-
-        # Temperature variables
-        if variable == vp.VX_VARIABLE_T_OUTSIDE:
-            self._check_status_change('outside_temp', self._ntc_to_cel(value))
-        elif variable == vp.VX_VARIABLE_T_EXHAUST:
-            self._check_status_change('exhaust_temp', self._ntc_to_cel(value))
-        elif variable == vp.VX_VARIABLE_T_INSIDE:
-            self._check_status_change('inside_temp', self._ntc_to_cel(value))
-        elif variable == vp.VX_VARIABLE_T_INCOMING:
-            self._check_status_change('incoming_temp', self._ntc_to_cel(value))
-
-        # RH variables
-        elif variable == vp.VX_VARIABLE_RH1:
-            self._check_status_change('rh1', self._hex_to_rh(value))
-        elif variable == vp.VX_VARIABLE_RH2:
-            self._check_status_change('rh2', self._hex_to_rh(value))
-
-        # CO2 variables
-        elif variable == vp.VX_VARIABLE_CO2_HI:
-            self.data['co2_hi'].last_received = now
-            self.data['co2_hi'].value = value
-            if now - self.data['co2_lo'].last_received < vp.CO2_LIFE_TIME_MS / 1000:
-                self._handle_co2_total_value(self.data['co2_hi'].value, 
-                                            self.data['co2_lo'].value)
-        elif variable == vp.VX_VARIABLE_CO2_LO:
-            self.data['co2_lo'].last_received = now
-            self.data['co2_lo'].value = value
-            if now - self.data['co2_hi'].last_received < vp.CO2_LIFE_TIME_MS / 1000:
-                self._handle_co2_total_value(self.data['co2_hi'].value, 
-                                            self.data['co2_lo'].value)
-
-        # Configuration variables
-        elif variable == vp.VX_VARIABLE_FAN_SPEED:
-            self.data['fan_speed'].last_received = now
-            self._check_status_change('fan_speed', 
-                                     self._hex_to_fan_speed(value))
-        elif variable == vp.VX_VARIABLE_DEFAULT_FAN_SPEED:
-            self.data['default_fan_speed'].last_received = now
-            self._check_status_change('default_fan_speed', 
-                                     self._hex_to_fan_speed(value))
-        elif variable == vp.VX_VARIABLE_STATUS:
-            self._decode_status(value)
-        elif variable == vp.VX_VARIABLE_IO_08:
-            self._decode_variable08(value)
-        elif variable == vp.VX_VARIABLE_FLAGS_06:
-            self._decode_flags06(value)
-        elif variable == vp.VX_VARIABLE_SERVICE_PERIOD:
-            self.data['service_period'].last_received = now
-            self._check_status_change('service_period', value)
-        elif variable == vp.VX_VARIABLE_SERVICE_COUNTER:
-            self.data['service_counter'].last_received = now
-            self._check_status_change('service_counter', value)
-        elif variable == vp.VX_VARIABLE_HEATING_TARGET:
-            self.data['heating_target'].last_received = now
-            self._check_status_change('heating_target', 
-                                     self._ntc_to_cel(value))
-        elif variable == vp.VX_VARIABLE_PROGRAM:
-            self._decode_program(value)
+        handler = self._handlers.get(variable)
+        if handler is not None:
+            # Mark the variable received first, so its handler sees it counted
+            if self._received != RECEIVED_ALL:
+                self._received |= RECEIVED_BITS.get(variable, 0)
+            handler(value, now)
 
         # Check if initialization is complete
         if not self.full_init_done:
             self.full_init_done = self._is_status_init_done()
             if self.full_init_done:
-                for k, _ in self.data.items():
+                for k in self._public_keys:
                     self._call_status_changed(k)
 
-    def _decode_status(self, status: int):
+    def _decode_temperature(self, name: str, field: ValueWithTimestamp, value: int, now: float):
+        """Decode NTC temperature byte"""
+        field.last_received = now
+        celsius = vp.VX_TEMPS[value]
+        if field.value == celsius:
+            return
+        self._update_field(name, field, celsius)
+        if self._is_temperature_init_done():
+            self._call_temperature_changed()
+
+    def _decode_rh(self, name: str, field: ValueWithTimestamp, value: int, _now: float):
+        """Decode relative humidity byte"""
+        self._update_field(name, field, vp.VX_RH_DECODE[value])
+
+    def _decode_co2(self, is_hi: bool, value: int, now: float):
+        """Decode CO2 high or low byte, combining it with a recent other half"""
+        hi, lo = self._co2_hi, self._co2_lo
+        field, other = (hi, lo) if is_hi else (lo, hi)
+        field.last_received = now
+        field.value = value
+        if now - other.last_received < CO2_LIFE_TIME:
+            self._handle_co2_total_value(hi.value, lo.value)
+
+    def _decode_fan_speed(self, name: str, field: ValueWithTimestamp, value: int, now: float):
+        """Decode fan speed byte"""
+        field.last_received = now
+        self._update_field(name, field, vp.VX_FAN_SPEED_DECODE[value])
+
+    def _decode_counter(self, name: str, field: ValueWithTimestamp, value: int, now: float):
+        """Decode plain month counter byte"""
+        field.last_received = now
+        self._update_field(name, field, value)
+
+    def _decode_heating_target(self, value: int, now: float):
+        """Decode heating target byte"""
+        field = self._heating_target_field
+        field.last_received = now
+        self._update_field('heating_target', field, vp.VX_TEMPS[value])
+
+    def _decode_status(self, status: int, now: float):
         """Decode status byte"""
-        now = time.monotonic()
+        for field in self._status_fields:
+            field.last_received = now
+
+        status_field = self._status_field
+        status_field.last_received = now
+        if status_field.value == status:
+            # Same byte decodes to the flags already stored
+            self.status_mutex = False
+            return
+        status_field.value = status
 
-        self.data['is_on'].last_received = now
-        self.data['is_rh_mode'].last_received = now
-        self.data['is_heating_mode'].last_received = now
-        self.data['is_filter'].last_received = now
-        self.data['is_heating'].last_received = now
-        self.data['is_fault'].last_received = now
-        self.data['is_service_needed'].last_received = now
-
-        self.data['status'].value = status
-        self.data['status'].last_received = now
-
-        self._check_status_change('is_on', 
-                                 (status & vp.VX_STATUS_FLAG_POWER) != 0)
-        self._check_status_change('is_rh_mode', 
-                                 (status & vp.VX_STATUS_FLAG_RH) != 0)
-        self._check_status_change('is_heating_mode', 
-                                 (status & vp.VX_STATUS_FLAG_HEATING_MODE) != 0)
-        self._check_status_change('is_filter', 
-                                 (status & vp.VX_STATUS_FLAG_FILTER) != 0)
-        self._check_status_change('is_heating', 
-                                 (status & vp.VX_STATUS_FLAG_HEATING) != 0)
-        self._check_status_change('is_fault', 
-                                 (status & vp.VX_STATUS_FLAG_FAULT) != 0)
-        self._check_status_change('is_service_needed', 
-                                 (status & vp.VX_STATUS_FLAG_SERVICE) != 0)
+        update_field = self._update_field
+        for name, field, flag in zip(STATUS_FLAG_NAMES, self._status_fields,
+                                     vp.VX_STATUS_DECODE[status]):
+            update_field(name, field, flag)
 
         self.status_mutex = False
 
-    def _decode_variable08(self, variable08: int):
+    def _decode_variable08(self, variable08: int, now: float):
         """Decode variable 08 byte"""
-        now = time.monotonic()
+        for field in self._variable08_fields:
+            field.last_received = now
 
-        self.data['is_summer_mode'].last_received = now
-        self.data['is_error_relay'].last_received = now
-        self.data['is_motor_in'].last_received = now
-        self.data['is_front_heating'].last_received = now
-        self.data['is_motor_out'].last_received = now
-        self.data['is_extra_func'].last_received = now
-
-        self.data['variable08'].value = variable08
-        self.data['variable08'].last_received = now
-
-        self._check_status_change('is_summer_mode', 
-                                 (variable08 & vp.VX_08_FLAG_SUMMER_MODE) != 0)
-        self._check_status_change('is_error_relay', 
-                                 (variable08 & vp.VX_08_FLAG_ERROR_RELAY) != 0)
-        self._check_status_change('is_motor_in', 
-                                 (variable08 & vp.VX_08_FLAG_MOTOR_IN) != 0)
-        self._check_status_change('is_front_heating', 
-                                 (variable08 & vp.VX_08_FLAG_FRONT_HEATING) != 0)
-        self._check_status_change('is_motor_out', 
-                                 (variable08 & vp.VX_08_FLAG_MOTOR_OUT) != 0)
-        self._check_status_change('is_extra_func', 
-                                 (variable08 & vp.VX_08_FLAG_EXTRA_FUNC) != 0)
-
-    def _decode_flags06(self, flags06: int):
-        """Decode flags 06 byte"""
-        now = time.monotonic()
+        variable08_field = self._variable08_field
+        variable08_field.last_received = now
+        if variable08_field.value == variable08:
+            return
+        variable08_field.value = variable08
 
-        self.data['is_switch_active'].last_received = now
-        self.data['flags06'].value = flags06
-        self.data['flags06'].last_received = now
+        update_field = self._update_field
+        for name, field, flag in zip(VARIABLE08_FLAG_NAMES, self._variable08_fields,
+                                     vp.VX_08_DECODE[variable08]):
+            update_field(name, field, flag)
 
-        self._check_status_change('is_switch_active', 
-                                 (flags06 & vp.VX_06_FIREPLACE_FLAG_IS_ACTIVE) != 0)
+    def _decode_flags06(self, flags06: int, now: float):
+        """Decode flags 06 byte"""
+        switch_field = self._switch_active_field
+        switch_field.last_received = now
+        flags06_field = self._flags06_field
+        flags06_field.last_received = now
+        if flags06_field.value == flags06:
+            return
+        flags06_field.value = flags06
+
+        self._update_field('is_switch_active', switch_field,
+                           (flags06 & vp.VX_06_FIREPLACE_FLAG_IS_ACTIVE) != 0)
 
-    def _decode_program(self, program: int):
+    def _decode_program(self, program: int, now: float):
         """Decode program byte"""
         should_inform = not self.settings['is_boost_setting'].last_received
 
-        now = time.monotonic()
         self.settings['is_boost_setting'].last_received = now
         self.settings['program'].value = program
         self.settings['program'].last_received = now
@@ -713,14 +824,11 @@ class Vallox(Device):
             return
 
         # Send to mainboards/specific target
-        message = bytearray([
-            vp.VX_MSG_DOMAIN,
-            vp.VX_MSG_THIS_PANEL,
-            target,
-            variable,
-            value,
-            0
-        ])
+        message = self._tx
+        message[1] = vp.VX_MSG_THIS_PANEL
+        message[2] = target
+        message[3] = variable
+        message[4] = value
         message[5] = self._calculate_checksum(message)
 
         self.serial.write(message)
@@ -740,30 +848,41 @@ class Vallox(Device):
         if not self.status_mutex:
             self.status_mutex = True
             self._set_variable(variable, value, vp.VX_MSG_MAINBOARD_1)
+            # Callers update the flag fields optimistically, so keep the byte
+            # in step; a differing reply from the unit is then decoded in full.
+            self.data['status'].value = value
             self.last_retry_loop = time.monotonic()
             return True
         return False
 
     def _request_variable(self, variable: int):
-        """Request variable value from Vallox"""
+        """Queue a variable value request to Vallox"""
         if not self.serial or not self.serial.is_open:
             return
+        if variable not in self._requests:
+            self._requests.append(variable)
 
-        message = bytearray([
-            vp.VX_MSG_DOMAIN,
-            vp.VX_MSG_THIS_PANEL,
-            vp.VX_MSG_MAINBOARD_1,
-            vp.VX_MSG_POLL_BYTE,
-            variable,
-            0
-        ])
+    def _send_next_request(self, now: float):
+        """Send the oldest queued request once the bus has had time to answer"""
+        if not self._requests or now < self._next_request:
+            return
+        if not self.serial or not self.serial.is_open:
+            self._requests.clear()
+            return
+        variable = self._requests.popleft()
+        self._next_request = now + vp.REQUEST_SPACING
+
+        message = self._tx
+        message[1] = vp.VX_MSG_THIS_PANEL
+        message[2] = vp.VX_MSG_MAINBOARD_1
+        message[3] = vp.VX_MSG_POLL_BYTE
+        message[4] = variable
         message[5] = self._calculate_checksum(message)
 
         if self._debug and self.packet_callback:
             self.packet_callback(bytes(message), "packetSent")
 
         self.serial.write(message)
-        time.sleep(0.1)  # Small delay after request
 
     # Request methods
     def _send_status_req(self):
@@ -804,127 +923,60 @@ class Vallox(Device):
             return vp.VX_FAN_SPEEDS[fan - 1]
         return vp.VX_FAN_SPEED_1
 
-    @staticmethod
-    def _hex_to_fan_speed(hex_val: int) -> int:
-        """Convert hex value to fan speed (1-8)"""
-        try:
-            return vp.VX_FAN_SPEEDS.index(hex_val) + 1
-        except ValueError:
-            return vp.NOT_SET
-
-    @staticmethod
-    def _ntc_to_cel(ntc: int) -> int:
-        """Convert NTC value to Celsius"""
-        if 0 <= ntc < len(vp.VX_TEMPS):
-            return vp.VX_TEMPS[ntc]
-        return vp.NOT_SET
-
     @staticmethod
     def _cel_to_ntc(cel: int) -> int:
         """Convert Celsius to NTC value"""
-        try:
-            return vp.VX_TEMPS.index(cel)
-        except ValueError:
-            return 0x83  # Default to 10°C
-
-    @staticmethod
-    def _hex_to_rh(hex_val: int) -> int:
-        """Convert hex value to RH percentage"""
-        if hex_val >= 51:
-            return int((hex_val - 51) / 2.04)
-        return vp.NOT_SET
+        return vp.VX_CEL_TO_NTC.get(cel, 0x83)  # Default to 10°C
 
     # Helper methods
     @staticmethod
-    def _calculate_checksum(message: bytearray) -> int:
-        """Calculate message checksum"""
-        return sum(message[:5]) & 0xFF
-
-    def _validate_checksum(self, message: bytes) -> bool:
-        """Validate message checksum"""
-        calculated = self._calculate_checksum(bytearray(message[:5]))
-        received = message[5]
-
-        if calculated != received:
-            self._debug_print("Checksum comparison failed!")
-            return False
-        return True
+    def _calculate_checksum(message) -> int:
+        """Calculate checksum over the first five bytes of a message"""
+        return (message[0] + message[1] + message[2] + message[3] + message[4]) & 0xFF
 
-    def _check_status_change(self, name: str, new_value: Any):
-        """Check and update status field if changed"""
-        values = {**self.data, **self.settings}
-        data_field = values[name]
-        if data_field.value != new_value:
-            data_field.value = new_value
-            self.data['updated'] = time.monotonic()
-            if self.full_init_done:
-                self._call_status_changed(name)
-
-    def _check_value_change(self, name: str, new_value: Any):
-        """Check and update value field if changed (for temperatures, CO2, RH)"""
-        data_field: ValueWithTimestamp= self.data[name]
-        data_field.last_received = time
-        if data_field.value != new_value:
-            data_field.value = new_value
-            self.data['updated'] = time
-            if self._is_temperature_init_done():
-                self._call_temperature_changed()
+    def _update_field(self, name: str, field: ValueWithTimestamp, new_value: Any):
+        """Update a field and notify if it changed, stamped with the loop pass time"""
+        if field.value == new_value:
+            return
+        field.value = new_value
+        self.data['updated'] = self._now
+        if self.full_init_done:
+            self._call_status_changed(name)
 
     def _handle_co2_total_value(self, hi: int, lo: int):
         """Construct CO2 value from high and low bytes"""
-        total = lo + (hi << 8)
-        self._check_status_change('co2', total)
+        hilo = (hi, lo)
+        if hilo == self._co2_hilo:
+            return
+        self._co2_hilo = hilo
+        self._update_field('co2', self._co2_field, lo + (hi << 8))
 
     def _is_temperature_init_done(self) -> bool:
         """Check if all temperatures have been received"""
-        return (self.data['outside_temp'].last_received and
-                self.data['inside_temp'].last_received and
-                self.data['exhaust_temp'].last_received and
-                self.data['incoming_temp'].last_received)
+        return self._received & TEMPERATURE_MASK == TEMPERATURE_MASK
 
     def _is_status_init_done(self) -> bool:
         """Check if all status values have been received"""
-        return (self.data['is_on'].last_received and
-                self.data['is_rh_mode'].last_received and
-                self.data['is_heating_mode'].last_received and
-                self.data['variable08'].last_received and
-                self.data['is_filter'].last_received and
-                self.data['is_heating'].last_received and
-                self.data['is_fault'].last_received and
-                self.data['is_service_needed'].last_received and
-                self.data['fan_speed'].last_received and
-                self.data['default_fan_speed'].last_received and
-                self.data['service_period'].last_received and
-                self.data['service_counter'].last_received and
-                self.data['heating_target'].last_received)
-
-    def _retry_loop(self):
+        return self._received & STATUS_MASK == STATUS_MASK
+
+    def _retry_loop(self, now: float):
         """Retry missing requests and clear mutex"""
         self._send_missing_requests()
         self.status_mutex = False
-        self.last_retry_loop = time.monotonic()
+        self.last_retry_loop = now
 
     def _send_missing_requests(self):
         """Send requests for missing data"""
-        if not self.data['is_on'].last_received:
-            self._send_status_req()
-        if not self.data['variable08'].last_received:
-            self._send_io08_req()
-        if not self.data['fan_speed'].last_received:
-            self._send_fan_speed_req()
-        if not self.data['default_fan_speed'].last_received:
-            self._send_default_fan_speed_req()
-        if not self.data['service_period'].last_received:
-            self._send_service_period_req()
-        if not self.data['service_counter'].last_received:
-            self._send_service_counter_req()
-        if not self.data['heating_target'].last_received:
-            self._send_heating_target_req()
+        received = self._received
+        if received & STATUS_MASK == STATUS_MASK:
+            return
+        for variable in _STATUS_VARIABLES:
+            if not received & RECEIVED_BITS[variable]:
+                self._request_variable(variable)
 
     def _call_status_changed(self, name: str):
         """Call status changed callback if set"""
-        values = {**self.data, **self.settings}
-        value = values[name]
+        value = self.data[name] if name in self.data else self.settings[name]
         value = value.value if isinstance(value, ValueWithTimestamp) else value
         self.on_property_changed(name, value)
         if self.status_changed_callback:
@@ -935,13 +987,16 @@ class Vallox(Device):
         if self.temperature_changed_callback:
             self.temperature_changed_callback()
 
-    def _debug_print(self, message: str):
-        """Print debug message"""
-        if self._debug:
-            if self.debug_print_callback:
-                self.debug_print_callback(message)
-            else:
-                print(f"[DEBUG] {message}")
+    def _debug_print(self, message: str, *args):
+        """Print debug message, %-formatting args only when debug is on"""
+        if not self._debug:
+            return
+        if args:
+            message = message % args
+        if self.debug_print_callback:
+            self.debug_print_callback(message)
+        else:
+            print("[DEBUG] " + message)
 
 
     async def poll_device(self, state: LoopState):
@@ -951,12 +1006,27 @@ class Vallox(Device):
         if self.connect():
             print("Connected to Vallox device.")
 
-        while not state.stop.is_set():
-            self.loop()
-            await asyncio.sleep(0.1)
-
-        self.disconnect()
-        print("Polling Vallox device stopped.")
+        loop = asyncio.get_running_loop()
+        use_reader = self.start_reader(loop)
+        try:
+            while not state.stop.is_set():
+                self.loop()
+                if not use_reader:
+                    timeout = POLL_INTERVAL
+                else:
+                    # Frames are handled as they arrive; wake only to pace requests
+                    timeout = self.next_wakeup()
+                # Wait for the next pass, but return at once on stop
+                try:
+                    await asyncio.wait_for(state.stop.wait(), timeout=timeout)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if use_reader:
+                self.stop_reader(loop)
+            self.disconnect()
+            print("Polling Vallox device stopped.")
 
 def create_devices():
     """Create and return a list of vallox devices and their polling functions."""
@@ -1,6 +1,7 @@
 """
 Vallox Digit SE Communication Protocol Constants
 """
+from array import array
 
 # Message structure
 VX_MSG_LENGTH = 6
@@ -45,6 +46,17 @@ VX_STATUS_FLAG_HEATING = 0x20
 VX_STATUS_FLAG_FAULT = 0x40
 VX_STATUS_FLAG_SERVICE = 0x80
 
+# Status flags decoded into properties, in decode order
+VX_STATUS_FLAGS = (
+    VX_STATUS_FLAG_POWER,
+    VX_STATUS_FLAG_RH,
+    VX_STATUS_FLAG_HEATING_MODE,
+    VX_STATUS_FLAG_FILTER,
+    VX_STATUS_FLAG_HEATING,
+    VX_STATUS_FLAG_FAULT,
+    VX_STATUS_FLAG_SERVICE
+)
+
 # Flags of variable 08
 VX_08_FLAG_SUMMER_MODE = 0x02
 VX_08_FLAG_ERROR_RELAY = 0x04
@@ -53,6 +65,16 @@ VX_08_FLAG_FRONT_HEATING = 0x10
 VX_08_FLAG_MOTOR_OUT = 0x20
 VX_08_FLAG_EXTRA_FUNC = 0x40
 
+# Variable 08 flags decoded into properties, in decode order
+VX_08_FLAGS = (
+    VX_08_FLAG_SUMMER_MODE,
+    VX_08_FLAG_ERROR_RELAY,
+    VX_08_FLAG_MOTOR_IN,
+    VX_08_FLAG_FRONT_HEATING,
+    VX_08_FLAG_MOTOR_OUT,
+    VX_08_FLAG_EXTRA_FUNC
+)
+
 # Flags of variable 06 (boost/fireplace)
 VX_06_FIREPLACE_FLAG_ACTIVATE = 0x20
 VX_06_FIREPLACE_FLAG_IS_ACTIVE = 0x40
@@ -72,8 +94,8 @@ VX_FAN_SPEED_8 = 0xFF
 VX_MIN_FAN_SPEED = 1
 VX_MAX_FAN_SPEED = 8
 
-# Fan speed conversion table
-VX_FAN_SPEEDS = [
+# Fan speed conversion table, packed one byte per speed
+VX_FAN_SPEEDS = bytes([
     VX_FAN_SPEED_1,
     VX_FAN_SPEED_2,
     VX_FAN_SPEED_3,
@@ -82,10 +104,10 @@ VX_FAN_SPEEDS = [
     VX_FAN_SPEED_6,
     VX_FAN_SPEED_7,
     VX_FAN_SPEED_8
-]
+])
 
-# NTC temperature conversion table
-VX_TEMPS = [
+# NTC temperature conversion table, packed as signed bytes
+VX_TEMPS = array('b', [
     -74, -70, -66, -62, -59, -56, -54, -52, -50, -48,  # 0x00 - 0x09
     -47, -46, -44, -43, -42, -41, -40, -39, -38, -37,  # 0x0a - 0x13
     -36, -35, -34, -33, -33, -32, -31, -30, -30, -29,  # 0x14 - 0x1d
@@ -112,10 +134,26 @@ VX_TEMPS = [
     62, 63, 65, 66, 68, 69, 71, 73, 75, 77,            # 0xe6 - 0xef
     79, 81, 82, 86, 90, 93, 97, 100, 100, 100,         # 0xf0 - 0xf9
     100, 100, 100, 100, 100, 100                       # 0xfa - 0xff
-]
+])
+# First NTC value for each Celsius reading, as VX_TEMPS.index() would give
+VX_CEL_TO_NTC = {}
+for _ntc, _cel in enumerate(VX_TEMPS):
+    VX_CEL_TO_NTC.setdefault(_cel, _ntc)
+del _ntc, _cel
 
 # Special values
 NOT_SET = -999
 QUERY_INTERVAL = 300  # seconds (5 minutes)
 RETRY_INTERVAL = 5    # seconds
+REQUEST_SPACING = 0.1  # seconds between variable requests
 CO2_LIFE_TIME_MS = 2000  # milliseconds
+
+# Reverse lookups indexed by a received byte
+# Flag states for each status / variable 08 byte value, in decode order
+VX_STATUS_DECODE = tuple(tuple((b & m) != 0 for m in VX_STATUS_FLAGS) for b in range(256))
+VX_08_DECODE = tuple(tuple((b & m) != 0 for m in VX_08_FLAGS) for b in range(256))
+# Fan speed (1-8) for each byte value, NOT_SET if the byte is not a fan speed
+VX_FAN_SPEED_DECODE = tuple(VX_FAN_SPEEDS.index(b) + 1 if b in VX_FAN_SPEEDS else NOT_SET
+                            for b in range(256))
+# Relative humidity (%) for each byte value, NOT_SET below the sensor range
+VX_RH_DECODE = tuple(int((b - 51) / 2.04) if b >= 51 else NOT_SET for b in range(256))
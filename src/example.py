@@ -6,6 +6,7 @@ This demonstrates basic usage of the Vallox library to read status
 and control a Vallox air conditioning unit via serial port.
 """
 
+import select
 import time
 from vallox import Vallox
 
@@ -79,19 +80,31 @@ def main():
     print("Connected successfully!")
     print("Waiting for initialization...\n")
     
+    # Wait on the serial descriptor where select supports it. On Windows
+    # the port has no selectable descriptor, so poll with a short sleep.
+    try:
+        fd = vx.serial.fileno()
+        select.select([fd], [], [], 0)
+    except (AttributeError, OSError, ValueError):
+        fd = None
+
+    init_printed = False
     try:
         # Main loop
         while True:
+            if fd is not None:
+                # Block until the serial port has data. The timeout lets
+                # vx.loop() send queued requests and retries on an idle bus.
+                select.select([fd], [], [], vx.next_wakeup())
+            else:
+                time.sleep(0.1)
             vx.loop()
             
             # Check if initialization is complete
-            if vx.init_ok and not hasattr(main, 'init_printed'):
+            if not init_printed and vx.init_ok:
                 print("\n=== Initialization Complete ===")
-                main.init_printed = True
-            
-            # Small sleep to prevent CPU hogging
-            time.sleep(0.1)
-            
+                init_printed = True
+
     except KeyboardInterrupt:
         print("\n\nShutting down...")
     finally:
@@ -6,11 +6,17 @@ import sys
 import os
 from os import environ as env
 import importlib
+import logging
 from typing import Callable, List, Tuple
 from dotenv import load_dotenv
 from core import DeviceManager, Device
 from core import LoopState
-from core import misc_task, mqtt_supervisor
+from core import mqtt_supervisor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 create_devices: List[Callable[[], List[Device]]] = []
 
@@ -37,8 +43,6 @@ async def run_tasks(state: LoopState):
                                                   on_disconnected,
                                                   on_message)))
 
-    tasks.append(asyncio.create_task(misc_task(state)))
-
     for create_devices_func in create_devices:
         devices = create_devices_func()
         for device in devices:  
@@ -51,6 +55,8 @@ def main():
     """Entry point for running the application."""
     if sys.platform.startswith("win"):
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -80,6 +86,8 @@ def main():
 
 if __name__ == "__main__":
     load_dotenv()
+    logging.basicConfig(level=env.get("LOG_LEVEL", "WARNING").upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     module_names_env = env.get("DEVICE_MODULES", None)
     if not module_names_env:
         print("Error: DEVICE_MODULES environment variable is not set.")